@@ -20,7 +20,7 @@ def parse_arguments():
     return args
 
 def extract_booklist(annotxml):
-    return list(set([itemelem.attrib["xml"] for itemelem in annotxml.findall(".//item")]))
+    return list(set([itemelem.attrib["xml"] for itemelem in annotxml.iter("item")]))
 
 def extract_sentid(idstr):
     ids = idstr.split(" ")
@@ -33,11 +33,11 @@ def main():
     input_doc = MarkerDoc(sys.stdin)
 
     for bookid in input_doc.booklist:
-        logging.info(f"Processing book: {bookid}")
+        logging.info("Processing book: %s", bookid)
         book = BookDoc(bookid, lang="cs", bookdir=args.book_dir)
         for itemelem in input_doc.annots_by_bookid(bookid):
             sentid = extract_sentid(itemelem.attrib["cs"])
-            logging.debug(f"Storing sentence {sentid} into the annotation item {itemelem.attrib['id']}")
+            logging.debug("Storing sentence %s into the annotation item %s", sentid, itemelem.attrib["id"])
             itemelem.attrib["cssent"] = book.get_sentence(sentid)
 
     input_doc.xml.write(sys.stdout, encoding="unicode", xml_declaration=True)
@@ -2,10 +2,7 @@ import xml.etree.ElementTree as xmlparser
 import sys
 import argparse
 
-ns = {
-    "" : "http://www.korpus.cz/imfSchema",
-    "xsi" : "http://www.w3.org/2001/XMLSchema-instance",
-}
+from intercorp import ns, S_TAG, W_TAG
 
 parser = argparse.ArgumentParser(description="A script to add ids to <w> tags in the original Intercorp format.")
 args = parser.parse_args()
@@ -15,9 +12,9 @@ for prefix, uri in ns.items():
 
 xml = xmlparser.parse(sys.stdin)
 
-for s in xml.findall('.//s', ns):
+for s in xml.iter(S_TAG):
     sent_id = s.attrib["id"]
-    for i, w in enumerate(s.findall('.//w', ns)):
+    for i, w in enumerate(s.iter(W_TAG)):
         w.attrib["id"] = f"{sent_id}:w{i+1}"
 
 xml.write(sys.stdout, encoding="unicode")
@@ -31,16 +31,16 @@ def main():
     #    return
 
     for bookid in input_doc.booklist:
-        logging.info(f"Processing book: {bookid}")
+        logging.info("Processing book: %s", bookid)
         walign = WAlignDoc(bookid, waligndir=args.walign_dir)
         for itemelem in input_doc.annots_by_bookid(bookid):
             envalue_old = itemelem.attrib.get("en", "")
             if envalue_old:
-                logging.warning(f"Aligned en words already annotated for item {itemelem.attrib['id']}: {envalue_old}")
+                logging.warning("Aligned en words already annotated for item %s: %s", itemelem.attrib["id"], envalue_old)
                 continue
             envalue = walign.get_aligned(itemelem.attrib["cs"])
             itemelem.attrib["en"] = envalue
-            logging.debug(f"Storing aligned ids {envalue} into the annotation item {itemelem.attrib['id']}")
+            logging.debug("Storing aligned ids %s into the annotation item %s", envalue, itemelem.attrib["id"])
 
     input_doc.xml.write(sys.stdout, encoding="unicode", xml_declaration=True)
 
@@ -1,62 +1,129 @@
-from collections import defaultdict
+from itertools import groupby
 import logging
+from operator import itemgetter
 import os
+import sys
 import xml.etree.ElementTree as xmlparser
 
 class BookDoc:
-    
+
+    __slots__ = (
+        "id",
+        "lang",
+        "_sent_index",
+        "_tok_index",
+        "_tok_seq",
+        "_sentid_to_tuid",
+        "_sent_text_cache",
+        "_tuid_sentids",
+        "_tuid_ranges",
+    )
+
     def __init__(self, bookid, lang="cs", bookdir=""):
         self.id = bookid
         self.lang = lang
         filepath = os.path.join(bookdir, f"{bookid}-{lang}.xml")
-        self.xml = xmlparser.parse(filepath)
-        self._build_index()
+        self._build_index(filepath)
 
-    def _build_index(self):
+    def _build_index(self, filepath):
         self._sent_index = {}
         self._tok_index = {}
         self._tok_seq = []
         self._sentid_to_tuid = {}
-        self._tuid_to_sentids = defaultdict(list)
+        self._sent_text_cache = {}
+        # local aliases to avoid attribute lookups in the per-token loop
+        tok_index = self._tok_index
+        tok_seq_append = self._tok_seq.append
+        intern = sys.intern
         tok_idx = 0
-        for sentelem in self.xml.findall('.//s'):
-            sent_start_idx = tok_idx
-            for tokelem in sentelem.findall('.//tok'):
-                #logging.debug(f"{tokelem = }")
-                self._tok_index[tokelem.attrib["id"]] = tok_idx
-                self._tok_seq.append(tokelem.text)
-                tok_idx += 1
-            sent_end_idx = tok_idx
-            sid = sentelem.attrib["id"]
-            self._sent_index[sid] = (sent_start_idx, sent_end_idx)
-            tuid = sentelem.attrib["tuid"]
-            self._sentid_to_tuid[sid] = tuid
-            self._tuid_to_sentids[tuid].append(sid)
+        # stream the book, only the indexes are kept, not the whole tree
+        open_elems = []
+        in_sent = False
+        for event, elem in xmlparser.iterparse(filepath, events=("start", "end")):
+            if event == "start":
+                open_elems.append(elem)
+                if elem.tag == "s":
+                    in_sent = True
+                continue
+            open_elems.pop()
+            if elem.tag == "s":
+                in_sent = False
+                sent_attrib = elem.attrib
+                sid = sent_attrib["id"]
+                sent_start_idx = tok_idx
+                for tokelem in elem.iter('tok'):
+                    #logging.debug(f"{tokelem = }")
+                    tokid = tokelem.attrib["id"]
+                    tok_index[tokid] = tok_idx
+                    # token forms repeat a lot across a book, share a single copy of each
+                    text = tokelem.text
+                    tok_seq_append(intern(text) if text else text)
+                    tok_idx += 1
+                sent_end_idx = tok_idx
+                self._sent_index[sid] = (sent_start_idx, sent_end_idx)
+                # sentences of the same translation unit share a single tuid string
+                tuid = intern(sent_attrib["tuid"])
+                self._sentid_to_tuid[sid] = tuid
+            elif in_sent:
+                # tokens are detached together with their sentence
+                continue
+            # detach the finished element from its parent, so that it can be freed
+            if open_elems:
+                open_elems[-1].remove(elem)
+        self._build_tuid_index()
+
+    def _build_tuid_index(self):
+        # all sentence IDs grouped by tuid (in the document order within a group) in a single list,
+        # with the range of each tuid's group stored separately
+        sentid_tuid_pairs = sorted(self._sentid_to_tuid.items(), key=itemgetter(1))
+        self._tuid_sentids = [sid for sid, _ in sentid_tuid_pairs]
+        self._tuid_ranges = {}
+        start_idx = 0
+        for tuid, group in groupby(sentid_tuid_pairs, key=itemgetter(1)):
+            end_idx = start_idx + sum(1 for _ in group)
+            self._tuid_ranges[tuid] = (start_idx, end_idx)
+            start_idx = end_idx
+
+    def _get_sentid(self, tokid):
+        # token IDs are built as "<sentid>:w<n>"
+        return tokid.rpartition(":")[0]
 
     def get_token(self, tokid):
         tokidx = self._tok_index.get(tokid)
-        if not tokidx:
+        if tokidx is None:
             return None
         return self._tok_seq[tokidx]
 
     def get_sentence(self, sentid):
+        # the same sentences are requested repeatedly (via tokids as well as via tuids)
+        sent = self._sent_text_cache.get(sentid)
+        if sent is not None:
+            return sent
         sent_range = self._sent_index.get(sentid)
-        if not sent_range:
+        if sent_range is None:
             return None
         sent_toks = self._tok_seq[sent_range[0]:sent_range[1]]
-        return " ".join(sent_toks)
+        sent = " ".join(sent_toks)
+        self._sent_text_cache[sentid] = sent
+        return sent
 
     def get_sentences_by_tokids(self, tokids, with_tuids=False):
-        sentids = list(set([":".join(tokid.split(":")[:-1]) for tokid in tokids]))
-        sents = [self.get_sentence(sentid) for sentid in sorted(sentids)]
+        sentids = sorted({self._get_sentid(tokid) for tokid in tokids})
+        sents = [self.get_sentence(sentid) for sentid in sentids]
         tuids = None
         if with_tuids:
-            tuids = [self._sentid_to_tuid.get(sentid) for sentid in sorted(sentids)]
+            tuids = [self._sentid_to_tuid.get(sentid) for sentid in sentids]
         return sents, tuids
 
+    def _get_sentids_by_tuid(self, tuid):
+        start_idx, end_idx = self._tuid_ranges.get(tuid, (0, 0))
+        return self._tuid_sentids[start_idx:end_idx]
+
     def get_sentences_by_tuids(self, tuids):
-        sentids = sorted(list(set([sentid for tuid in tuids for sentid in self._tuid_to_sentids[tuid]])))
-        return [self.get_sentence(sentid) for sentid in sentids]
+        sentids = set()
+        for tuid in tuids:
+            sentids.update(self._get_sentids_by_tuid(tuid))
+        return [self.get_sentence(sentid) for sentid in sorted(sentids)]
 
     @property
     def tok_index(self):
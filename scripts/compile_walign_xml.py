@@ -1,4 +1,4 @@
-import xml.etree.ElementTree as xmlparser
+from xml.sax.saxutils import escape
 import argparse
 import sys
 
@@ -7,8 +7,12 @@ parser.add_argument("for_align_ids_file", type=str, help="Path to a file with ID
 parser.add_argument("align_file", type=str, help="Path to the file with corresponding aligner's outputs.")
 args = parser.parse_args()
 
-root_elem = xmlparser.Element("walign")
-xml = xmlparser.ElementTree(root_elem)
+def escape_attr(value):
+    return escape(value, {'"': "&quot;"})
+
+# the links are printed as they come instead of building the whole tree in memory
+out = sys.stdout
+out.write("<?xml version='1.0' encoding='utf-8'?>\n<walign>")
 
 with open(args.for_align_ids_file, "r") as ids_f, open(args.align_file) as align_f:
     for ids_l, align_l in zip(ids_f, align_f):
@@ -17,11 +21,10 @@ with open(args.for_align_ids_file, "r") as ids_f, open(args.align_file) as align
         if not align_l:
             continue
         src_ids, tgt_ids = [s.split(" ") for s in ids_l.split(" ||| ")]
-        align_pairs = (p.split("-") for p in align_l.split(" "))
-        for src_ord, tgt_ord in align_pairs:
-            attrib = {
-                "src": src_ids[int(src_ord)],
-                "tgt": tgt_ids[int(tgt_ord)]
-            }
-            xmlparser.SubElement(root_elem, "link", attrib)
-xml.write(sys.stdout, encoding="unicode", xml_declaration=True)
+        for align_pair in align_l.split(" "):
+            src_ord, tgt_ord = align_pair.split("-")
+            src_id = escape_attr(src_ids[int(src_ord)])
+            tgt_id = escape_attr(tgt_ids[int(tgt_ord)])
+            out.write(f'<link src="{src_id}" tgt="{tgt_id}" />')
+
+out.write("</walign>")
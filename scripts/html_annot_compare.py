@@ -1,4 +1,6 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 import os
 import xml.etree.ElementTree as xmlparser
@@ -74,10 +76,13 @@ def init_template_data(annot_names):
 def deref_attrs_by_book(annot_elem, book, attrs):
     for attr_name in attrs:
         tok_deref_str = annot_elem.attrib.get(attr_name, "")
+        # nothing to dereference, the raw (empty) value is displayed instead
+        if not tok_deref_str:
+            continue
         tok_ids = tok_deref_str.strip().split(" ")
-        if tok_ids and tok_ids[0] in book.tok_index:
+        if tok_ids[0] in book.tok_index:
             tok_deref_str = " ".join([(token if (token := book.get_token(tokid)) else tokid) for tokid in tok_ids])
-        elif tok_deref_str:
+        else:
             tok_deref_str = f'"{tok_deref_str}"'
         annot_elem.attrib[attr_name + ".deref"] = tok_deref_str
 
@@ -136,7 +141,8 @@ def configure_template(args):
     display_f = lambda k, v=None: v if v else k
     if args.annot_def:
         annot_def_doc = MarkerDocDef(args.annot_def)
-        display_f = annot_def_doc.get_display_string
+        # called for every attribute value of every compared item, with few distinct arguments
+        display_f = lru_cache(maxsize=None)(annot_def_doc.get_display_string)
     template_env.globals['display_str'] = display_f
 
 def render_template(template_name, **context):
@@ -150,7 +156,10 @@ def parse_arguments():
     parser.add_argument("input_files", nargs="+", help="input files to be compared")
     parser.add_argument("--book-dir", type=str, help="directory with books in the teitok format")
     parser.add_argument("--annot-def", type=str, help="path to the annotation definition file")
+    parser.add_argument("--io-threads", type=int, help="number of threads used to load the input files in parallel (default: load them one by one)")
     args = parser.parse_args()
+    if args.io_threads is not None and args.io_threads < 1:
+        parser.error("--io-threads must be at least 1")
     return args
 
 def main():
@@ -160,7 +169,12 @@ def main():
         logging.error("More than one input files must be specified.")
         exit()
 
-    doc_list = [MarkerDoc(filepath) for filepath in args.input_files]
+    if args.io_threads:
+        # loading is dominated by file reading on cold caches, so overlap it in threads
+        with ThreadPoolExecutor(max_workers=args.io_threads) as executor:
+            doc_list = list(executor.map(MarkerDoc, args.input_files))
+    else:
+        doc_list = [MarkerDoc(file) for file in args.input_files]
 
     deref_index_attrs_all(doc_list, args.book_dir)
 
@@ -4,10 +4,7 @@ import sys
 import re
 import argparse
 
-ns = {
-    "" : "http://www.korpus.cz/imfSchema",
-    "xsi" : "http://www.w3.org/2001/XMLSchema-instance",
-}
+from intercorp import ns, S_TAG, W_TAG
 
 tei_header_xml = """
 <teiHeader>
@@ -73,9 +70,9 @@ def remove_text_attrs(xml):
         text_elem.attrib.pop(attr)
 
 def process_tokens(xml):
-    for s in xml.findall('.//s', ns):
+    for s in xml.iter(S_TAG):
         sent_id = s.attrib["id"]
-        for i, w in enumerate(s.findall('.//w', ns)):
+        for i, w in enumerate(s.iter(W_TAG)):
             # rename the token element from "w" to "tok" 
             w.tag = "tok"
             w.attrib["id"] = f"{sent_id}:w{i+1}"
@@ -101,7 +98,7 @@ def add_alignment_units(xml, salign_xml, align_ord, page_break=100):
     for ch_elem in ch_elems:
         text_elem.remove(ch_elem)
 
-    for i, node in enumerate(salign_xml.findall(f".//link")):
+    for i, node in enumerate(salign_xml.iter("link")):
         if page_break and i % page_break == 0:
             text_elem.append(xmlparser.Element("pb", {"id": f"page-{i+1}"}))
         sides = node.attrib["xtargets"].split(";")
@@ -122,7 +119,7 @@ def add_alignment_units(xml, salign_xml, align_ord, page_break=100):
 
 def add_tuids(xml, salign_xml, align_ord):
     sid2tuid = {}
-    for i, node in enumerate(salign_xml.findall(f".//link"), 1):
+    for i, node in enumerate(salign_xml.iter("link"), 1):
         sides = node.attrib["xtargets"].split(";")
         if sides[align_ord] == "":
             print(f"Skiping tuid=tu-{i}", file=sys.stderr)
@@ -131,8 +128,7 @@ def add_tuids(xml, salign_xml, align_ord):
         for sid in tu_sids:
             sid2tuid[sid] = f"tu-{i}"
 
-    s_elems = xml.findall(f".//s", ns)
-    for s_elem in s_elems:
+    for s_elem in xml.iter(S_TAG):
         sid = s_elem.attrib["id"]
         if not sid:
             print(f"Sentence ID = {sid} not defined.", file=sys.stderr)
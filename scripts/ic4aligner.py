@@ -2,18 +2,15 @@ import xml.etree.ElementTree as xmlparser
 import argparse
 import sys
 
-ns = {
-    "" : "http://www.korpus.cz/imfSchema",
-    "xsi" : "http://www.w3.org/2001/XMLSchema-instance",
-}
+from intercorp import S_TAG, W_TAG
 
 def load_text_xml(path):
     text_xml = xmlparser.parse(path)
     sentid2words = {}
-    for sent_node in text_xml.findall(".//s", ns):
+    for sent_node in text_xml.iter(S_TAG):
         sentid = sent_node.attrib["id"]
         words = []
-        for word_node in sent_node.findall(".//w", ns):
+        for word_node in sent_node.iter(W_TAG):
             words.append((word_node.attrib["id"], word_node.text))
         sentid2words[sentid] = words
     # add empty sentid
@@ -40,7 +37,7 @@ salign_xml = xmlparser.parse(args.salign_file)
 if args.output_ids:
     ids_f = open(args.output_ids, "w")
 
-for i, node in enumerate(salign_xml.findall(f".//link")):
+for i, node in enumerate(salign_xml.iter("link")):
     print(f"Processing link no. {i}", file=sys.stderr)
     src_sentidstr, tgt_sentidstr = node.attrib["xtargets"].split(";")
     src_sent = extract_sent_from_sentidstr(src_sentidstr, src_sentid2words)
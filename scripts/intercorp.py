@@ -0,0 +1,8 @@
+# namespaces of the original InterCorp XML format
+ns = {
+    "" : "http://www.korpus.cz/imfSchema",
+    "xsi" : "http://www.w3.org/2001/XMLSchema-instance",
+}
+# qualified tags for iter(), which does not take a namespace map
+S_TAG = f"{{{ns['']}}}s"
+W_TAG = f"{{{ns['']}}}w"
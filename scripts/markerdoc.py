@@ -8,12 +8,19 @@ class MarkerDoc:
         self.xml = xmlparser.parse(file)
         self.annot_elems = self._annots()
         self._booklist = None
+        self._annots_by_bookid = None
 
     def __iter__(self):
         return iter(self.annot_elems.values())
 
     def _annots(self):
-        return {e.attrib["id"]:e for e in self.xml.findall(".//item")}
+        return {e.attrib["id"]:e for e in self.xml.iter("item")}
+
+    def _group_by_bookid(self):
+        annots_by_bookid = defaultdict(list)
+        for itemelem in self:
+            annots_by_bookid[itemelem.attrib["xml"]].append(itemelem)
+        return annots_by_bookid
 
     def _extract_booklist(self):
         return list(set([itemelem.attrib["xml"] for itemelem in self]))
@@ -29,7 +36,11 @@ class MarkerDoc:
         return self.annot_elems.keys()
 
     def annots_by_bookid(self, bookid):
-        return [itemelem for itemelem in self.annot_elems.values() if itemelem.attrib["xml"] == bookid]
+        # group all the items at once rather than scanning them again for every book
+        if self._annots_by_bookid is None:
+            self._annots_by_bookid = self._group_by_bookid()
+        # a copy, so that the callers cannot modify the grouping
+        return list(self._annots_by_bookid.get(bookid, []))
 
     def annot_by_id(self, annot_id):
         return self.annot_elems.get(annot_id)
@@ -39,32 +50,32 @@ class MarkerDocDef:
 
     def __init__(self, file):
         self.xml = xmlparser.parse(file)
-        self._build_type_index()
-        self._build_display_index()
-
-    def _build_display_index(self):
-        self._key_display_index = {}
-        self._value_display_index = {}
-        for interp_elem in self.xml.findall(".//interp"):
-            key = interp_elem.attrib["key"]
-            self._key_display_index[key] = interp_elem.attrib["display"]
-            self._value_display_index[key] = {}
-            for option_elem in interp_elem.findall("./option"):
-                val = option_elem.attrib["value"]
-                self._value_display_index[key][val] = option_elem.attrib["display"]
+        self._build_index()
 
-    def _build_type_index(self):
+    def _build_index(self):
+        # the type and the display indexes are filled in a single pass over the definitions
         self._all_attr_names = []
         self._type_index = {}
+        self._names_by_type = defaultdict(list)
         self._ref_index = {}
-        for interp_elem in self.xml.findall(".//interp"):
+        self._names_by_ref = defaultdict(list)
+        self._key_display_index = {}
+        self._value_display_index = {}
+        for interp_elem in self.xml.iter("interp"):
             key = interp_elem.attrib["key"]
             self._all_attr_names.append(key)
             attr_type = interp_elem.attrib.get("type", "input")
             self._type_index[key] = attr_type
+            self._names_by_type[attr_type].append(key)
             if attr_type == "lookup":
                 ref = interp_elem.attrib["ref"]
                 self._ref_index[key] = ref
+                self._names_by_ref[ref].append(key)
+            self._key_display_index[key] = interp_elem.attrib["display"]
+            self._value_display_index[key] = {}
+            for option_elem in interp_elem.findall("./option"):
+                val = option_elem.attrib["value"]
+                self._value_display_index[key][val] = option_elem.attrib["display"]
 
     def get_display_string(self, key, value=None):
         if value is None:
@@ -77,9 +88,12 @@ class MarkerDocDef:
         return ", ".join(split_displays)
 
     def attr_names(self, type=None, ref=None):
-        names = self._all_attr_names
-        if type:
-            names = [name for name in names if self._type_index[name] == type]
+        # copies, so that the callers cannot modify the indexes
         if ref:
-            names = [name for name in names if self._ref_index[name] == ref]
-        return names
+            # only the lookup attributes refer to other attributes
+            if type and type != "lookup":
+                return []
+            return list(self._names_by_ref.get(ref, []))
+        if type:
+            return list(self._names_by_type.get(type, []))
+        return list(self._all_attr_names)
@@ -7,8 +7,6 @@ from collections import defaultdict
 import random
 import logging
 
-from markerdoc import MarkerDoc
-
 class QueryGroup:
     def __init__(self, path):
         self.query_map = {}
@@ -53,6 +51,14 @@ class OutputDoc:
     def write(self, path):
         self.xmldoc.write(path, encoding='utf-8', xml_declaration=True)
 
+def iter_annotated_cs_ids(path):
+    # only the cs IDs are needed, so the file is streamed rather than loaded as a whole
+    for _, elem in xmlparser.iterparse(path):
+        if elem.tag != "item":
+            continue
+        yield from elem.attrib["cs"].split(" ")
+        elem.clear()
+
 
 parser = argparse.ArgumentParser(description="A script to sample occurences and split them among the annotators")
 parser.add_argument("--output-dir", type=str, default='.', help="Directory to generate outputs")
@@ -79,14 +85,13 @@ items_per_srclang_rest = {l:defaultdict(list) for l in args.srclangs}
 # debug prints of all collected examples
 already_annotated = set()
 for path in args.skip_annotated:
-    cs_ids = [cs_id for item in MarkerDoc(path) for cs_id in item.attrib["cs"].split(" ")]
-    already_annotated.update(cs_ids)
+    already_annotated.update(iter_annotated_cs_ids(path))
 #logging.debug(already_annotated)
 
 all_qids = set()
 
 xml = xmlparser.parse(sys.stdin)
-for occur_elem in xml.findall('.//item'):
+for occur_elem in xml.iter('item'):
     cs_id = occur_elem.attrib["cs"]
     # skip if the occurence has already been annotated
     if cs_id in already_annotated:
@@ -102,7 +107,7 @@ for occur_elem in xml.findall('.//item'):
 
 for srclang in items_per_srclang_rest:
     for qid in items_per_srclang_rest[srclang]:
-        logging.debug(f"{qid} {srclang} {len(items_per_srclang_rest[srclang][qid])}")
+        logging.debug("%s %s %d", qid, srclang, len(items_per_srclang_rest[srclang][qid]))
 
 max_for_qid = None
 if args.equal_across_srclangs:
@@ -1,6 +1,6 @@
 import argparse
 import logging
-import re
+from operator import itemgetter
 import sys
 import xml.etree.ElementTree as xmlparser
 
@@ -20,8 +20,15 @@ def parse_arguments():
     args = parser.parse_args()
     return args
 
-def key_to_sort(value_bundle):
-    token_id = value_bundle[0]
+def is_token_id(value):
+    # the same as matching ^(en|cs):.*w[0-9]+$, without the regex engine
+    if not value.startswith(("en:", "cs:")):
+        return False
+    wpos = value.rfind("w")
+    tok_num = value[wpos+1:]
+    return wpos >= 3 and tok_num.isascii() and tok_num.isdigit()
+
+def token_sort_key(token_id):
     tok_items = token_id.split(":")
     new_tok_items = tok_items[0:2] + [int(x) for x in tok_items[3:5]] + [int(tok_items[5].lstrip("w"))]
     return tuple(new_tok_items)
@@ -32,19 +39,32 @@ def main():
     input_doc = MarkerDoc(sys.stdin)
     annot_def_doc = MarkerDocDef(args.annot_def)
 
+    # the definition does not change between items, look up the attribute names only once
+    idref_lookup_attrs = [
+        (idref_attr, annot_def_doc.attr_names(type="lookup", ref=idref_attr))
+        for idref_attr in annot_def_doc.attr_names(type="idrefs")
+    ]
+
     for annot_elem in input_doc:
-        for idref_attr in annot_def_doc.attr_names(type="idrefs"):
-            annot_value_items = annot_elem.attrib.get(idref_attr, "").split(" ")
-            if not annot_value_items:
+        for idref_attr, lookup_attr_names in idref_lookup_attrs:
+            annot_value = annot_elem.attrib.get(idref_attr)
+            # most items leave most of the idrefs attributes empty
+            if not annot_value:
                 continue
-            if any([not re.match(r"^(en:|cs:).*w[0-9]+$", annot_value_item) for annot_value_item in annot_value_items]):
+            annot_value_items = annot_value.split(" ")
+            if any([not is_token_id(annot_value_item) for annot_value_item in annot_value_items]):
                 continue
-            lookup_attr_names = annot_def_doc.attr_names(type="lookup", ref=idref_attr)
             lookup_lists = [annot_elem.attrib[lookup_attr_name].split(" ") for lookup_attr_name in lookup_attr_names]
+            sort_keys = [token_sort_key(annot_value_item) for annot_value_item in annot_value_items]
+            # the values are mostly in order already, such items are left untouched
+            # unless the rewrite below would trim the lists to the same length
+            if (all(len(lookup_list) == len(annot_value_items) for lookup_list in lookup_lists)
+                    and all(key <= next_key for key, next_key in zip(sort_keys, sort_keys[1:]))):
+                continue
             
-            bundles_to_sort = list(zip(annot_value_items, *lookup_lists))
-            bundles_to_sort.sort(key=key_to_sort)
-            sorted_annot_value_items, *sorted_lookup_lists = zip(*bundles_to_sort)
+            bundles_to_sort = list(zip(sort_keys, annot_value_items, *lookup_lists))
+            bundles_to_sort.sort(key=itemgetter(0))
+            _, sorted_annot_value_items, *sorted_lookup_lists = zip(*bundles_to_sort)
             
             annot_elem.attrib[idref_attr] = " ".join(sorted_annot_value_items)
             for i, lookup_attr_name in enumerate(lookup_attr_names):
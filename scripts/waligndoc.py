@@ -10,17 +10,22 @@ class WAlignDoc:
         self.align_langs = align_langs
         align_pair = "-".join(align_langs)
         filepath = os.path.join(waligndir, f"{bookid}_{align_pair}.xml")
-        self.xml = xmlparser.parse(filepath)
-        self._build_index()
+        self._build_index(filepath)
 
-    def _build_index(self):
+    def _build_index(self, filepath):
         self._src2tgt = defaultdict(list)
         self._tgt2src = defaultdict(list)
-        for linkelem in self.xml.findall('.//link'):
+        # stream the alignment, the processed links are dropped from the tree right away
+        context = xmlparser.iterparse(filepath, events=("start", "end"))
+        _, root = next(context)
+        for event, linkelem in context:
+            if event != "end" or linkelem.tag != "link":
+                continue
             #logging.debug(f"ALIGN SRC ID: {linkelem.attrib['src']}")
             #logging.debug(f"ALIGN TGT ID: {linkelem.attrib['tgt']}")
             self._src2tgt[linkelem.attrib["src"]].append(linkelem.attrib["tgt"])
             self._src2tgt[linkelem.attrib["tgt"]].append(linkelem.attrib["src"])
+            root.clear()
 
     def get_aligned(self, widstr, src_lang="cs"):
         if src_lang == self.align_langs[1]: